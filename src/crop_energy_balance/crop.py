@@ -26,13 +26,13 @@ class CropStateVariables:
             weather.convert_kelvin_to_celsius(inputs.air_temperature, constants.absolute_zero))
         self.zero_displacement_height = canopy.calc_zero_displacement_height(
             canopy_height=inputs.canopy_height,
-            leaf_area_index=sum(inputs.leaf_layers.values()),
+            leaf_area_index=inputs.total_leaf_area_index,
             drag_coefficient=params.simulation.drag_coefficient)
         self.roughness_length_for_momentum = canopy.calc_roughness_length_for_momentum_transfer(
             soil_roughness_length_for_momentum=params.simulation.soil_roughness_length_for_momentum,
             zero_plan_displacement_height=self.zero_displacement_height,
             canopy_height=inputs.canopy_height,
-            total_leaf_area_index=sum(inputs.leaf_layers.values()),
+            total_leaf_area_index=inputs.total_leaf_area_index,
             drag_coefficient=params.simulation.drag_coefficient)
         self.roughness_length_for_heat_transfer = canopy.calc_roughness_length_for_heat_transfer(
             roughness_length_for_momentum_transfer=self.roughness_length_for_momentum,
@@ -238,6 +238,16 @@ class Component:
             actual_value=self.temperature,
             step_fraction=params.numerical_resolution.step_fraction)
 
+    def accelerate_temperature(self,
+                               accelerated_temperature: float):
+        """Replaces the temperature step by a value calculated outside the component (e.g. by Anderson acceleration).
+
+        Args:
+            accelerated_temperature: [K] temperature to be used in the next iteration
+        """
+        self._temperature = self.temperature
+        self.temperature = accelerated_temperature
+
 
 class SoilComponent(Component):
     def __init__(self,
@@ -274,7 +284,7 @@ class SoilComponent(Component):
             von_karman_constant=constants.von_karman)
         self.net_longwave_radiation = soil.calc_net_longwave_radiation(
             canopy_top_net_longwave_radiation=crop_state_variables.net_longwave_radiation,
-            canopy_leaf_area_index=sum(inputs.leaf_layers.values()),
+            canopy_leaf_area_index=inputs.total_leaf_area_index,
             diffuse_black_extinction_coefficient=params.simulation.diffuse_black_extinction_coefficient)
         self.heat_flux = soil.calc_heat_flux(
             net_above_ground_radiation=crop_state_variables.net_radiation,
@@ -517,13 +527,6 @@ class SunlitShadedLeafComponent(LeafComponent):
 
 
 class Crop(dict):
-    def __getitem__(self, key):
-        val = dict.__getitem__(self, key)
-        return val
-
-    def __setitem__(self, key, val):
-        dict.__setitem__(self, key, val)
-
     def __init__(self,
                  leaves_category: str,
                  inputs: Inputs = None,
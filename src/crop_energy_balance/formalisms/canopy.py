@@ -1,4 +1,4 @@
-from math import log, atan, pi, exp
+from math import log, atan, pi, exp, sqrt
 
 from crop_energy_balance.formalisms.config import PRECISION
 from crop_energy_balance.formalisms.weather import convert_celsius_to_kelvin
@@ -85,6 +85,22 @@ def calc_roughness_length_for_heat_transfer(roughness_length_for_momentum_transf
     return ratio_heat_to_momentum_roughness_lengths * roughness_length_for_momentum_transfer
 
 
+def calc_log_height_ratio(measurement_height: float,
+                          zero_displacement_height: float,
+                          roughness_length: float) -> float:
+    """Calculates the logarithm of the ratio of the height above the zero plane displacement to the roughness length.
+
+    Args:
+        measurement_height: [m] height at which meteorological measurements are made
+        zero_displacement_height: [m] zero plane displacement height
+        roughness_length: [m] roughness length for either momentum or heat transfer
+
+    Returns:
+        [-] logarithm of the height ratio
+    """
+    return log((measurement_height - zero_displacement_height) / roughness_length)
+
+
 def calc_wind_speed_at_canopy_height(wind_speed: float,
                                      canopy_height: float,
                                      measurement_height: float,
@@ -106,8 +122,9 @@ def calc_wind_speed_at_canopy_height(wind_speed: float,
     canopy_height = max(0.1, canopy_height)
 
     return max(PRECISION,
-               wind_speed * log((canopy_height - zero_displacement_height) / roughness_length_for_momentum) / log(
-                   (measurement_height - zero_displacement_height) / roughness_length_for_momentum))
+               wind_speed * calc_log_height_ratio(canopy_height, zero_displacement_height,
+                                                  roughness_length_for_momentum) /
+               calc_log_height_ratio(measurement_height, zero_displacement_height, roughness_length_for_momentum))
 
 
 def calc_net_longwave_radiation(air_temperature: float,
@@ -297,7 +314,7 @@ def calc_turbulent_aerodynamic_resistance(friction_velocity: float,
 
     """
     return 1.0 / (von_karman_constant * friction_velocity) * (
-        (log((measurement_height - zero_displacement_height) / roughness_length_for_heat) -
+        (calc_log_height_ratio(measurement_height, zero_displacement_height, roughness_length_for_heat) -
          stability_correction_for_heat))
 
 
@@ -444,7 +461,7 @@ def calc_friction_velocity(wind_speed: float,
         [m h-1]: friction velocity
     """
     return von_karman_constant * wind_speed / (
-            log((measurement_height - zero_displacement_height) / roughness_length_for_momentum)
+            calc_log_height_ratio(measurement_height, zero_displacement_height, roughness_length_for_momentum)
             - stability_correction_for_momentum)
 
 
@@ -513,13 +530,13 @@ def calc_richardson_number(is_stable: bool,
         According to Webber et al. (2016) turbulence condition is considered stable if canopy's temperature is lower
             the air's, otherwise unstable
     """
+    height_above_displacement = measurement_height - zero_displacement_height
     if is_stable:
         # Webb (1970) in Monteith and Unsworth (2013)
-        richardson = (measurement_height - zero_displacement_height) / (
-                monin_obukhov_length + 5 * (measurement_height - zero_displacement_height))
+        richardson = height_above_displacement / (monin_obukhov_length + 5 * height_above_displacement)
     else:
         # Monteith and Unsworth (2013)
-        richardson = (measurement_height - zero_displacement_height) / monin_obukhov_length
+        richardson = height_above_displacement / monin_obukhov_length
 
     return richardson
 
@@ -554,9 +571,10 @@ def calc_stability_correction_functions(monin_obukhov_length: float,
         # unstable
         # ----------------------
         # Colaizzi et al. 2004, eq. 12)
-        x = (1.0 - 16.0 * (measurement_height - zero_displacement_height) / monin_obukhov_length) ** 0.25
-        correction_for_heat = 2.0 * log((1 + x ** 2) / 2)  # (Liu et al. 2007, eq. 13)
-        correction_for_momentum = 2.0 * log((1 + x) / 2) + log((1 + x ** 2) / 2) - 2 * atan(x) + pi / 2.
+        x = sqrt(sqrt(1.0 - 16.0 * (measurement_height - zero_displacement_height) / monin_obukhov_length))
+        log_half_one_plus_x_squared = log((1 + x * x) / 2)
+        correction_for_heat = 2.0 * log_half_one_plus_x_squared  # (Liu et al. 2007, eq. 13)
+        correction_for_momentum = 2.0 * log((1 + x) / 2) + log_half_one_plus_x_squared - 2 * atan(x) + pi / 2.
     elif richardson_number < 0.2:
         # ----------------------
         # stable - technically (Thom, 1975)
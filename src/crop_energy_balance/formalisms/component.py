@@ -13,7 +13,11 @@ def calc_boundary_layer_resistance(forced_convection_resistance: float,
         [h m-1] boundary resistance under both forced and free convection conditions
     """
 
-    return 1. / (1. / max(PRECISION, forced_convection_resistance) + 1. / max(PRECISION, free_convection_resistance))
+    # conditional expressions are used instead of max() since this function is called at each solver iteration
+    forced_convection_resistance = (forced_convection_resistance if forced_convection_resistance > PRECISION
+                                    else PRECISION)
+    free_convection_resistance = free_convection_resistance if free_convection_resistance > PRECISION else PRECISION
+    return 1. / (1. / forced_convection_resistance + 1. / free_convection_resistance)
 
 
 def calc_composed_resistance(surface_resistance: float,
@@ -1,4 +1,5 @@
-from math import exp
+from functools import lru_cache
+from math import exp, expm1
 
 from numpy import trapz
 
@@ -31,8 +32,9 @@ def calc_leaf_layer_forced_convection_conductance(wind_speed_at_canopy_height: f
                                                                        characteristic_length,
                                                                        shape_parameter)
     scaling_factor = 2.0 / wind_speed_extinction_coefficient * (
-            exp(-0.5 * wind_speed_extinction_coefficient * upper_cumulative_leaf_area_index) -
-            exp(-0.5 * wind_speed_extinction_coefficient * lower_cumulative_leaf_area_index))
+            -exp(-0.5 * wind_speed_extinction_coefficient * upper_cumulative_leaf_area_index) *
+            expm1(-0.5 * wind_speed_extinction_coefficient * (
+                    lower_cumulative_leaf_area_index - upper_cumulative_leaf_area_index)))
 
     return leaf_boundary_conductance * scaling_factor
 
@@ -58,8 +60,14 @@ def calc_leaf_layer_forced_convection_resistance(wind_speed_at_canopy_height: fl
     Returns:
         [h m-1] boundary resistance under forced convection
     """
-    args = {k: v for k, v in locals().items() if k != 'stomatal_density_factor'}
-    return 1.0 / calc_leaf_layer_forced_convection_conductance(**args) / stomatal_density_factor
+    forced_convection_conductance = calc_leaf_layer_forced_convection_conductance(
+        wind_speed_at_canopy_height=wind_speed_at_canopy_height,
+        upper_cumulative_leaf_area_index=upper_cumulative_leaf_area_index,
+        lower_cumulative_leaf_area_index=lower_cumulative_leaf_area_index,
+        wind_speed_extinction_coefficient=wind_speed_extinction_coefficient,
+        characteristic_length=characteristic_length,
+        shape_parameter=shape_parameter)
+    return 1.0 / (forced_convection_conductance * stomatal_density_factor)
 
 
 def calc_leaf_layer_free_convection_conductance(upper_cumulative_leaf_area_index: float,
@@ -115,9 +123,15 @@ def calc_leaf_layer_free_convection_resistance(upper_cumulative_leaf_area_index:
         [h m-1] boundary resistance under free convection.
     """
 
-    args = {k: v for k, v in locals().items() if k != 'stomatal_density_factor'}
-    free_convection_conductance = max(PRECISION, calc_leaf_layer_free_convection_conductance(**args))
-    return 1.0 / free_convection_conductance / stomatal_density_factor
+    free_convection_conductance = calc_leaf_layer_free_convection_conductance(
+        upper_cumulative_leaf_area_index=upper_cumulative_leaf_area_index,
+        lower_cumulative_leaf_area_index=lower_cumulative_leaf_area_index,
+        layer_temperature=layer_temperature,
+        air_temperature=air_temperature,
+        heat_molecular_diffusivity=heat_molecular_diffusivity,
+        characteristic_length=characteristic_length)
+    free_convection_conductance = free_convection_conductance if free_convection_conductance > PRECISION else PRECISION
+    return 1.0 / (free_convection_conductance * stomatal_density_factor)
 
 
 def calc_leaf_layer_surface_conductance_to_vapor(incident_direct_irradiance: float,
@@ -163,32 +177,95 @@ def calc_leaf_layer_surface_conductance_to_vapor(incident_direct_irradiance: flo
     if incident_direct_irradiance + incident_diffuse_irradiance == 0:
         return residual_stomatal_conductance * (lower_cumulative_leaf_area_index - upper_cumulative_leaf_area_index)
     else:
-        sublayer_thickness = (lower_cumulative_leaf_area_index - upper_cumulative_leaf_area_index) / sublayers_number
-
-        leaf_surface_conductance = []
-        for cumulative_leaf_area_index in discretize_linearly(upper_cumulative_leaf_area_index,
-                                                              lower_cumulative_leaf_area_index, sublayers_number):
-            absorbed_irradiance = calc_absorbed_irradiance('lumped',
-                                                           incident_direct_irradiance,
-                                                           incident_diffuse_irradiance,
-                                                           cumulative_leaf_area_index,
-                                                           leaf_scattering_coefficient,
-                                                           canopy_reflectance_to_direct_irradiance,
-                                                           canopy_reflectance_to_diffuse_irradiance,
-                                                           direct_extinction_coefficient,
-                                                           direct_black_extinction_coefficient,
-                                                           diffuse_extinction_coefficient)
-
-            lumped_leaf_surface_conductance = leaf.calc_stomatal_conductance(
-                residual_stomatal_conductance=residual_stomatal_conductance,
-                maximum_stomatal_conductance=maximum_stomatal_conductance,
-                absorbed_irradiance=absorbed_irradiance,
-                shape_parameter=shape_parameter,
-                stomatal_sensibility_to_water_status=stomatal_sensibility_to_water_status)
-
-            leaf_surface_conductance.append(lumped_leaf_surface_conductance)
-
-        return trapz(leaf_surface_conductance, dx=sublayer_thickness)
+        leaf_layer_integral, irradiance_response_integral = calc_leaf_layer_absorbed_irradiance_integrals(
+            incident_direct_irradiance,
+            incident_diffuse_irradiance,
+            upper_cumulative_leaf_area_index,
+            lower_cumulative_leaf_area_index,
+            leaf_scattering_coefficient,
+            canopy_reflectance_to_direct_irradiance,
+            canopy_reflectance_to_diffuse_irradiance,
+            direct_extinction_coefficient,
+            direct_black_extinction_coefficient,
+            diffuse_extinction_coefficient,
+            shape_parameter,
+            sublayers_number)
+
+        # stomatal conductance is linear in both its residual and maximum values, hence the integral over the leaf
+        # layer is a linear combination of the irradiance-dependent integrals
+        return (residual_stomatal_conductance * leaf_layer_integral +
+                maximum_stomatal_conductance * stomatal_sensibility_to_water_status * irradiance_response_integral)
+
+
+@lru_cache(maxsize=256)
+def calc_leaf_layer_absorbed_irradiance_integrals(incident_direct_irradiance: float,
+                                                  incident_diffuse_irradiance: float,
+                                                  upper_cumulative_leaf_area_index: float,
+                                                  lower_cumulative_leaf_area_index: float,
+                                                  leaf_scattering_coefficient: float,
+                                                  canopy_reflectance_to_direct_irradiance: float,
+                                                  canopy_reflectance_to_diffuse_irradiance: float,
+                                                  direct_extinction_coefficient: float,
+                                                  direct_black_extinction_coefficient: float,
+                                                  diffuse_extinction_coefficient: float,
+                                                  shape_parameter: float,
+                                                  sublayers_number: int) -> (float, float):
+    """Calculates the integrals, over a leaf layer, of the leaf area and of the stomatal sensibility to the absorbed
+    irradiance.
+
+    Args:
+        incident_direct_irradiance: [W m-2ground] incident direct photosynthetically active radiation above the canopy
+        incident_diffuse_irradiance: [W m-2ground] incident diffuse irradiance at the top of the canopy
+        upper_cumulative_leaf_area_index: [m2leaf m-2ground] cumulative leaf area index above the considered layer
+        lower_cumulative_leaf_area_index: [m2leaf m-2ground] cumulative leaf area index below the considered layer
+        leaf_scattering_coefficient: [-] leaf scattering coefficient
+        canopy_reflectance_to_direct_irradiance: [-] canopy reflectance to direct (beam) irradiance
+        canopy_reflectance_to_diffuse_irradiance: [-] canopy reflectance to diffuse irradiance
+        direct_extinction_coefficient: [m2ground m-2leaf] the extinction coefficient of direct (beam) irradiance
+        direct_black_extinction_coefficient: [m2ground m-2leaf] the extinction coefficient of direct (beam)
+            irradiance for black leaves
+        diffuse_extinction_coefficient: [m2ground m-2leaf] the extinction coefficient of diffuse irradiance
+        shape_parameter: [W m-2leaf] an empirical parameter to regulate the shape of stomatal conductance response
+            to the absorbed photosynthetically active radiation (PAR)
+        sublayers_number: number of sublayers that are used to perform the numerical integrals
+
+    Returns:
+        [m2leaf m-2ground] integral of the leaf area over the leaf layer
+        [m2leaf m-2ground] integral of the stomatal sensibility to the absorbed irradiance over the leaf layer
+
+    Notes:
+        These integrals only depend on canopy structure and incident irradiance, which do not change during the
+            iterations of the energy balance solver, hence they are cached.
+        The integrals are calculated over `sublayers_number` points spaced by 1/`sublayers_number` of the layer
+            thickness, hence they cover (`sublayers_number` - 1)/`sublayers_number` of the leaf layer. The integral of
+            the leaf area is thus (`sublayers_number` - 1)/`sublayers_number` times the layer thickness.
+    """
+    sublayer_thickness = (lower_cumulative_leaf_area_index - upper_cumulative_leaf_area_index) / sublayers_number
+
+    stomatal_sensibility_to_absorbed_irradiance = []
+    for cumulative_leaf_area_index in discretize_linearly(upper_cumulative_leaf_area_index,
+                                                          lower_cumulative_leaf_area_index, sublayers_number):
+        absorbed_irradiance = calc_absorbed_irradiance('lumped',
+                                                       incident_direct_irradiance,
+                                                       incident_diffuse_irradiance,
+                                                       cumulative_leaf_area_index,
+                                                       leaf_scattering_coefficient,
+                                                       canopy_reflectance_to_direct_irradiance,
+                                                       canopy_reflectance_to_diffuse_irradiance,
+                                                       direct_extinction_coefficient,
+                                                       direct_black_extinction_coefficient,
+                                                       diffuse_extinction_coefficient)
+
+        stomatal_sensibility_to_absorbed_irradiance.append(leaf.calc_stomatal_conductance(
+            residual_stomatal_conductance=0,
+            maximum_stomatal_conductance=1,
+            absorbed_irradiance=absorbed_irradiance,
+            shape_parameter=shape_parameter,
+            stomatal_sensibility_to_water_status=1))
+
+    # the trapezoidal integral of a unit leaf fraction spans (sublayers_number - 1) intervals of sublayer_thickness
+    return ((sublayers_number - 1) * sublayer_thickness,
+            trapz(stomatal_sensibility_to_absorbed_irradiance, dx=sublayer_thickness))
 
 
 def calc_leaf_layer_surface_resistance_to_vapor(incident_direct_irradiance: float,
@@ -234,10 +311,25 @@ def calc_leaf_layer_surface_resistance_to_vapor(incident_direct_irradiance: floa
         (float): [h m-1] bulk surface resistance of the leaf layer
     """
 
-    args = {k: v for k, v in locals().items() if k != 'stomatal_density_factor'}
-    surface_conductance = max(PRECISION, calc_leaf_layer_surface_conductance_to_vapor(**args))
-
-    return stomatal_density_factor * (1.0 / surface_conductance)
+    surface_conductance = calc_leaf_layer_surface_conductance_to_vapor(
+        incident_direct_irradiance=incident_direct_irradiance,
+        incident_diffuse_irradiance=incident_diffuse_irradiance,
+        upper_cumulative_leaf_area_index=upper_cumulative_leaf_area_index,
+        lower_cumulative_leaf_area_index=lower_cumulative_leaf_area_index,
+        stomatal_sensibility_to_water_status=stomatal_sensibility_to_water_status,
+        leaf_scattering_coefficient=leaf_scattering_coefficient,
+        canopy_reflectance_to_direct_irradiance=canopy_reflectance_to_direct_irradiance,
+        canopy_reflectance_to_diffuse_irradiance=canopy_reflectance_to_diffuse_irradiance,
+        direct_extinction_coefficient=direct_extinction_coefficient,
+        direct_black_extinction_coefficient=direct_black_extinction_coefficient,
+        diffuse_extinction_coefficient=diffuse_extinction_coefficient,
+        maximum_stomatal_conductance=maximum_stomatal_conductance,
+        residual_stomatal_conductance=residual_stomatal_conductance,
+        shape_parameter=shape_parameter,
+        sublayers_number=sublayers_number)
+    surface_conductance = surface_conductance if surface_conductance > PRECISION else PRECISION
+
+    return stomatal_density_factor / surface_conductance
 
 
 def calc_leaf_layer_net_longwave_radiation(canopy_top_net_longwave_radiation: float,
@@ -261,6 +353,6 @@ def calc_leaf_layer_net_longwave_radiation(canopy_top_net_longwave_radiation: fl
             Leaf nitrogen, photosynthesis, conductance and transpiration: scaling from leaves to canopies.
             Plant, Cell and Environment 18, 1183 - 1200.
     """
-    scaling_factor = (exp(-diffuse_black_extinction_coefficient * upper_cumulative_leaf_area_index) -
-                      exp(-diffuse_black_extinction_coefficient * lower_cumulative_leaf_area_index))
+    scaling_factor = -exp(-diffuse_black_extinction_coefficient * upper_cumulative_leaf_area_index) * expm1(
+        -diffuse_black_extinction_coefficient * (lower_cumulative_leaf_area_index - upper_cumulative_leaf_area_index))
     return canopy_top_net_longwave_radiation * scaling_factor
@@ -47,17 +47,28 @@ def calc_atmospheric_emissivity(model: str,
             pp 72
     """
 
-    if model == 'brutsaert_1975':
-        res = 1.24 * (0.1 * air_vapor_pressure / air_temperature) ** (1. / 7.)
-    elif model == 'monteith_2013':
-        a = 0.10  # kg−1 m−2
-        b = 1.2
-        c = 0.30  # kg−1 m2
-        w = 4.65 * 1.e3 * air_vapor_pressure / air_temperature
-        res = 1 - (1 + a * w) * exp(-(b + c * w) ** 0.5)
-    else:
-        raise ValueError(f'Unknown model name: {model}.')
-    return res
+    try:
+        calc_emissivity = _ATMOSPHERIC_EMISSIVITY_MODELS[model]
+    except KeyError:
+        raise ValueError(f'Unknown model name: {model}.') from None
+    return calc_emissivity(air_vapor_pressure, air_temperature)
+
+
+def _calc_atmospheric_emissivity_brutsaert_1975(air_vapor_pressure: float, air_temperature: float) -> float:
+    return 1.24 * (0.1 * air_vapor_pressure / air_temperature) ** (1. / 7.)
+
+
+def _calc_atmospheric_emissivity_monteith_2013(air_vapor_pressure: float, air_temperature: float) -> float:
+    a = 0.10  # kg−1 m−2
+    b = 1.2
+    c = 0.30  # kg−1 m2
+    w = 4.65 * 1.e3 * air_vapor_pressure / air_temperature
+    return 1 - (1 + a * w) * exp(-(b + c * w) ** 0.5)
+
+
+_ATMOSPHERIC_EMISSIVITY_MODELS = {
+    'brutsaert_1975': _calc_atmospheric_emissivity_brutsaert_1975,
+    'monteith_2013': _calc_atmospheric_emissivity_monteith_2013}
 
 
 def calc_vapor_pressure_slope(temperature: float) -> float:
@@ -70,7 +81,8 @@ def calc_vapor_pressure_slope(temperature: float) -> float:
         [kPa K-1] the slope of vapor pressure curve at the given air temperature
 
     """
-    return 4098 * (0.6108 * exp((17.27 * temperature) / (temperature + 237.3))) / ((temperature + 237.3) ** 2)
+    temperature_offset = temperature + 237.3
+    return 4098 * 0.6108 * exp(17.27 * temperature / temperature_offset) / (temperature_offset * temperature_offset)
 
 
 def convert_kelvin_to_celsius(temperature: float,
@@ -1,8 +1,9 @@
-from json import load
+from math import fsum
 from pathlib import Path
 
 from crop_energy_balance import params
 from crop_energy_balance.formalisms import weather
+from crop_energy_balance.utils import read_json
 
 constants = params.Constants()
 
@@ -12,8 +13,7 @@ class Inputs:
                  inputs_dict: dict = None,
                  inputs_path: Path = None):
         if inputs_dict is None:
-            with open(str(inputs_path), mode='r', encoding='utf-8') as f:
-                inputs_dict = load(f)
+            inputs_dict = read_json(inputs_path)
 
         self._inputs = self._fmt_inputs(inputs_dict)
 
@@ -42,15 +42,6 @@ class Inputs:
         self.vapor_pressure_deficit = self._inputs['vapor_pressure_deficit']
         """[kPa] vapor pressure deficit of the air"""
 
-        self.psychrometric_constant = weather.calc_psychrometric_constant(
-            self._inputs['atmospheric_pressure'], constants.air_specific_heat_capacity,
-            constants.latent_heat_for_vaporization, constants.vapor_to_dry_air_molecular_weight)
-        """[kPa K-1] psychrometric constant
-
-        See Also:
-            :func:`calc_psychrometric_constant`
-        """
-
         self.leaf_layers = self._inputs['leaf_layers']
         """[m2leaf m-2ground] dictionary of leaf area index per layer
 
@@ -59,6 +50,9 @@ class Inputs:
             The uppermost layer must have the highest number while the lowermost layer has the lowest number.
         """
 
+        self.total_leaf_area_index = fsum(self.leaf_layers.values())
+        """[m2leaf m-2ground] total leaf area index of the canopy"""
+
         self.incident_irradiance = self._inputs['incident_photosynthetically_active_radiation']
         """[W_{PAR} m-2ground] dictionary of incident photosynthetically active radiation.
 
@@ -86,10 +80,27 @@ class Inputs:
         """(Rad) the angle between solar beam and the horizon.
         """
 
-        self.components_keys = sorted(list(self.leaf_layers.keys()) + [-1])
+        self.components_keys = [-1] + sorted(self.leaf_layers)
+
+        self._psychrometric_constant = None
+
+    @property
+    def psychrometric_constant(self) -> float:
+        """[kPa K-1] psychrometric constant, calculated at first access only
+
+        See Also:
+            :func:`calc_psychrometric_constant`
+        """
+        if self._psychrometric_constant is None:
+            self._psychrometric_constant = weather.calc_psychrometric_constant(
+                self._inputs['atmospheric_pressure'], constants.air_specific_heat_capacity,
+                constants.latent_heat_for_vaporization, constants.vapor_to_dry_air_molecular_weight)
+        return self._psychrometric_constant
 
     @staticmethod
     def _fmt_inputs(inputs: dict):
         for k in ('leaf_layers', 'absorbed_photosynthetically_active_radiation'):
-            inputs[k] = {int(key): value for key, value in inputs[k].items()}
+            # keys are already integers when inputs are built in Python, rather than read from a json file
+            if not all(type(key) is int for key in inputs[k]):
+                inputs[k] = dict(zip(map(int, inputs[k].keys()), inputs[k].values()))
         return inputs
@@ -1,4 +1,5 @@
-from json import load
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from crop_irradiance.uniform_crops.formalisms.sunlit_shaded_leaves import (calc_canopy_reflectance_to_direct_irradiance,
@@ -7,17 +8,23 @@ from crop_irradiance.uniform_crops.formalisms.sunlit_shaded_leaves import (calc_
                                                                            calc_direct_black_extinction_coefficient)
 
 from crop_energy_balance.formalisms.weather import calc_atmospheric_emissivity
+from crop_energy_balance.utils import read_json
+
+# diffuse extinction coefficients do not depend on solar inclination, hence they are shared by all the time steps of a
+# simulation having the same canopy structure
+_calc_diffuse_extinction_coefficient = lru_cache(maxsize=32)(calc_diffuse_extinction_coefficient)
 
 
 class Params:
+    __slots__ = ('_user_params', 'simulation', 'numerical_resolution')
+
     def __init__(self,
                  params_dict: dict = None,
                  params_path: Path = None):
         if params_dict:
             self._user_params = params_dict
         else:
-            with open(str(params_path), mode='r', encoding='utf-8') as f:
-                self._user_params = load(f)
+            self._user_params = read_json(params_path)
 
         self.simulation = Simulation(self._user_params)
 
@@ -28,62 +35,62 @@ class Params:
         self.simulation.update(inputs=inputs)
 
 
+@dataclass(frozen=True)
 class Constants:
-    def __init__(self):
-        self.gravitational_acceleration = 9.81 * (3600 ** 2)
-        """[m h-2] gravitational acceleration.
-        """
+    gravitational_acceleration: float = 9.81 * (3600 ** 2)
+    """[m h-2] gravitational acceleration.
+    """
 
-        self.von_karman = 0.41
-        """[-] von Karman constant"""
+    von_karman: float = 0.41
+    """[-] von Karman constant"""
 
-        self.stefan_boltzmann = 5.67e-8
-        """[W m-2 K-4] Stefan-Boltzmann constant"""
+    stefan_boltzmann: float = 5.67e-8
+    """[W m-2 K-4] Stefan-Boltzmann constant"""
 
-        self.absolute_zero = -273.15
-        """[°C] temeprature at absolute zero"""
+    absolute_zero: float = -273.15
+    """[°C] temeprature at absolute zero"""
 
-        self.latent_heat_for_vaporization = 0.678
-        """[W h g-1] latent heat for vaporization"""
+    latent_heat_for_vaporization: float = 0.678
+    """[W h g-1] latent heat for vaporization"""
 
-        self.psychrometric_constant = 0.066
-        """[kPa K-1] psychrometric constant"""
+    psychrometric_constant: float = 0.066
+    """[kPa K-1] psychrometric constant"""
 
-        self.air_specific_heat_capacity = 2.8e-4
-        """[W h g-1 K-1] specific heat capacity of the air under a constant pressure
+    air_specific_heat_capacity: float = 2.8e-4
+    """[W h g-1 K-1] specific heat capacity of the air under a constant pressure
 
-        References:
-            Allen et al. 1998
-                FAO Irrigation and Drainage Paper No. 56.
-                Eq. 8
-        """
+    References:
+        Allen et al. 1998
+            FAO Irrigation and Drainage Paper No. 56.
+            Eq. 8
+    """
 
-        self.vapor_to_dry_air_molecular_weight = 0.622
-        """[-] ratio of the molecular weights of water vapor to dry air
+    vapor_to_dry_air_molecular_weight: float = 0.622
+    """[-] ratio of the molecular weights of water vapor to dry air
 
-        References:
-            Allen et al. 1998
-                FAO Irrigation and Drainage Paper No. 56.
-                Eq. 8
-        """
+    References:
+        Allen et al. 1998
+            FAO Irrigation and Drainage Paper No. 56.
+            Eq. 8
+    """
 
-        self.air_density = 1185.0
-        """[g m-3] dry air density
-        """
+    air_density: float = 1185.0
+    """[g m-3] dry air density
+    """
 
-        self.ideal_gas_constant = 8.2057 * 1.e-5
-        """[m3 atm mol−1 K−1] Ideal gas constant
-        """
+    ideal_gas_constant: float = 8.2057 * 1.e-5
+    """[m3 atm mol−1 K−1] Ideal gas constant
+    """
 
-        self.molecular_diffusivity_water_vapor = 3600. * 1e-6 * 24.9
-        """[m2 h-1] Molecular diffusivity for water vapor at 25 degrees C.
+    molecular_diffusivity_water_vapor: float = 3600. * 1e-6 * 24.9
+    """[m2 h-1] Molecular diffusivity for water vapor at 25 degrees C.
 
-        References:
-            Monteith and Unsworth (2013).
-                Principles of Environmental Physics (Fourth Edition)
-                Academic Press, pp 289 - 320
-                Table A.3
-        """
+    References:
+        Monteith and Unsworth (2013).
+            Principles of Environmental Physics (Fourth Edition)
+            Academic Press, pp 289 - 320
+            Table A.3
+    """
 
 
 class Simulation:
@@ -187,17 +194,11 @@ class Simulation:
         self.canopy_reflectance_to_diffuse_irradiance = 0.057
         """[-] canopy reflectance to diffuse irradiance"""
 
-        if 'leaf_angle_distribution_factor' in data.keys():
-            self.leaf_angle_distribution_factor = data['leaf_angle_distribution_factor']
-        else:
-            self.leaf_angle_distribution_factor = 0.9773843811168246
+        self.leaf_angle_distribution_factor = data.get('leaf_angle_distribution_factor', 0.9773843811168246)
         """[-] factor describing leaf angle distribution (for spherical distributions its value equals
         rad(56) = 0.9773843811168246"""
 
-        if 'clumping_factor' in data.keys():
-            self.clumping_factor = data['clumping_factor']
-        else:
-            self.clumping_factor = 1
+        self.clumping_factor = data.get('clumping_factor', 1)
         """[-] clumping factor to describe the spatial dependency of the positions of the leaves"""
 
         self.sublayers_number = 100
@@ -220,27 +221,18 @@ class Simulation:
         self.diffuse_black_extinction_coefficient = None
         """[m2ground m-2leaf] extinction coefficient of diffuse photosynthetically active radiation for black leaves"""
 
-        if 'drag_coefficient' in data.keys():
-            self.drag_coefficient = data['drag_coefficient']
-        else:
-            self.drag_coefficient = 0.2
+        self.drag_coefficient = data.get('drag_coefficient', 0.2)
         """[m2ground m-2leaf] drag coefficient"""
 
-        if 'ratio_heat_to_momentum_canopy_roughness_lengths' in data.keys():
-            self.ratio_heat_to_momentum_canopy_roughness_lengths = data[
-                'ratio_heat_to_momentum_canopy_roughness_lengths']
-        else:
-            self.ratio_heat_to_momentum_canopy_roughness_lengths = 1 / 7.4
+        self.ratio_heat_to_momentum_canopy_roughness_lengths = data.get(
+            'ratio_heat_to_momentum_canopy_roughness_lengths', 1 / 7.4)
         """[-] Ratio of canopy's heat to momentum roughness lengths.
         Indicative values are:
             * 1/10 for reference grass crop (Shuttleworth, 2007. Hydrol. Earth Syst. Sci. 11, 210 - 244)
             * 1/7.4 for wheat (Kimball et al., 2015. Climatology and Water Management 107, 129 - 141)
         """
 
-        if 'richardon_threshold_free_convection' in data.keys():
-            self.richardon_threshold_free_convection = data['richardon_threshold_free_convection']
-        else:
-            self.richardon_threshold_free_convection = -0.8
+        self.richardon_threshold_free_convection = data.get('richardon_threshold_free_convection', -0.8)
         """[-] Richardson number threshold below which flux is assumed to occur under free convection.
         Note:
         Indicative values are:
@@ -251,16 +243,10 @@ class Simulation:
         self.atmospheric_emissivity = None
         """[-] sky longwave radiation emissivity"""
 
-        if 'atmospheric_emissivity_model' in data.keys():
-            self.atmospheric_emissivity_model = data['atmospheric_emissivity_model']
-        else:
-            self.atmospheric_emissivity_model = 'brutsaert_1975'
+        self.atmospheric_emissivity_model = data.get('atmospheric_emissivity_model', 'brutsaert_1975')
         """Name of the model to be used for calculating sky longwave radiation emissivity"""
 
-        if 'free_convection_shape_parameter' in data.keys():
-            self.free_convection_shape_parameter = data['free_convection_shape_parameter']
-        else:
-            self.free_convection_shape_parameter = 5
+        self.free_convection_shape_parameter = data.get('free_convection_shape_parameter', 5)
         """[W K-4/3 m-2] free convection shape parameter related to surface characteristics"""
 
     def update(self,
@@ -277,8 +263,8 @@ class Simulation:
             clumping_factor=self.clumping_factor)
 
         self.diffuse_extinction_coefficient, self.diffuse_black_extinction_coefficient = (
-            calc_diffuse_extinction_coefficient(
-                leaf_area_index=sum(inputs.leaf_layers.values()),
+            _calc_diffuse_extinction_coefficient(
+                leaf_area_index=inputs.total_leaf_area_index,
                 leaf_angle_distribution_factor=self.leaf_angle_distribution_factor,
                 clumping_factor=self.clumping_factor,
                 leaf_scattering_coefficient=self.leaf_scattering_coefficient,
@@ -297,6 +283,9 @@ class Simulation:
 
 
 class NumericalResolution:
+    __slots__ = ('step_fraction', 'acceptable_temperature_error', 'maximum_iteration_number',
+                 'anderson_acceleration_depth')
+
     def __init__(self, data):
         self.step_fraction = data['step_fraction']
         """[-] fraction of the entire temperature step (`actual_value - previous_value`) to be used"""
@@ -313,3 +302,14 @@ class NumericalResolution:
 
         self.maximum_iteration_number = data['maximum_iteration_number']
         """[-] maximum number of iterations to solve the energy budget"""
+
+        self.anderson_acceleration_depth = data.get('anderson_acceleration_depth', 0)
+        """[-] number of previous iterates used to accelerate the convergence of temperatures (Anderson acceleration).
+        If 0, temperatures are updated using `step_fraction` only. Otherwise, acceleration starts once `step_fraction`
+        is reduced for the first time (after 10 iterations), so that fast converging time steps are not affected.
+
+        See Also:
+            Walker and Ni, 2011
+                Anderson acceleration for fixed-point iterations.
+                SIAM Journal on Numerical Analysis 49, 1715 - 1735
+        """
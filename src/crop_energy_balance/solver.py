@@ -1,10 +1,11 @@
+from collections import deque
 from pathlib import Path
 
 from crop_energy_balance.crop import Crop, CropStateVariables, LeafComponent
 from crop_energy_balance.formalisms import canopy
 from crop_energy_balance.inputs import Inputs
 from crop_energy_balance.params import Params, Constants
-from crop_energy_balance.utils import is_almost_equal
+from crop_energy_balance.utils import calc_anderson_acceleration, is_almost_equal
 
 constants = Constants()
 
@@ -71,14 +72,31 @@ class Solver:
         """
         self.iterations_number = 0
         initial_step_fraction = self.crop.params.numerical_resolution.step_fraction
+        acceleration_depth = self.crop.params.numerical_resolution.anderson_acceleration_depth
+        iterates = deque(maxlen=acceleration_depth + 1)
+        images = deque(maxlen=acceleration_depth + 1)
         is_acceptable_error = False
         while not is_acceptable_error and self.iterations_number < 100:
             self.crop.params.numerical_resolution.step_fraction = initial_step_fraction / (
                     divmod(self.iterations_number, 10)[0] + 1)
             self.iterations_number += 1
+            if acceleration_depth > 0:
+                iterates.append([crop_component.temperature for crop_component in self.components])
             self.update_state_variables()
             self.error_temperature = self.calc_error()
-            self.update_temperature()
+
+            next_temperatures = None
+            if acceleration_depth > 0:
+                images.append([crop_component.temperature for crop_component in self.components])
+                # acceleration only starts once the step fraction has been reduced, i.e. when the plain iterations
+                # are slow to converge
+                if self.crop.params.numerical_resolution.step_fraction < initial_step_fraction:
+                    next_temperatures = calc_anderson_acceleration(iterates=list(iterates), images=list(images))
+
+            if next_temperatures is None:
+                self.update_temperature()
+            else:
+                self.accelerate_temperature(next_temperatures=next_temperatures)
             self.calc_energy_balance()
             is_acceptable_error = self.determine_if_acceptable_error()
 
@@ -119,6 +137,10 @@ class Solver:
         for crop_component in self.components:
             crop_component.update_temperature(self.params)
 
+    def accelerate_temperature(self, next_temperatures: list):
+        for crop_component, temperature in zip(self.components, next_temperatures):
+            crop_component.accelerate_temperature(accelerated_temperature=float(temperature))
+
     def calc_energy_balance(self):
         self.energy_balance = self.crop.state_variables.net_radiation - (
                 self.crop.state_variables.total_penman_monteith_evaporative_energy +
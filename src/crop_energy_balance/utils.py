@@ -1,3 +1,14 @@
+from pathlib import Path
+
+from numpy import array, diff, isfinite
+from numpy.linalg import lstsq
+
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+
 def calc_stomatal_density_factor(amphistomatal_leaf: bool) -> int:
     """Computes an integer that expresses whether stomata are equally present on both faces or on one face of the leaf
         blade
@@ -31,6 +42,34 @@ def calc_temperature_step(previous_value: float,
     return step_fraction * (actual_value - previous_value)
 
 
+def calc_anderson_acceleration(iterates: list,
+                               images: list) -> list:
+    """Calculates the next iterate of a fixed-point problem x = g(x) using Anderson acceleration.
+
+    Args:
+        iterates: successive iterates x_i, from the oldest to the newest, each being a list of values
+        images: images g(x_i) of the iterates, in the same order
+
+    Returns:
+        the next iterate, or None if less than two iterates are provided or if the extrapolation is not finite, in
+            which case the caller is expected to perform a plain fixed-point step
+
+    References:
+        Walker and Ni, 2011
+            Anderson acceleration for fixed-point iterations.
+            SIAM Journal on Numerical Analysis 49, 1715 - 1735
+    """
+    if len(images) < 2:
+        return None
+
+    images = array(images, dtype=float)
+    residuals = images - array(iterates, dtype=float)
+    mixing_coefficients = lstsq(diff(residuals, axis=0).T, residuals[-1], rcond=None)[0]
+    next_iterate = images[-1] - diff(images, axis=0).T @ mixing_coefficients
+
+    return list(next_iterate) if all(isfinite(next_iterate)) else None
+
+
 def discretize_linearly(inclusive_start: float,
                         inclusive_stop: float,
                         vector_length: int) -> list:
@@ -98,3 +137,15 @@ def assert_trend(values: list, expected_trend: str) -> None or AssertionError:
     elif expected_trend == '+-':
         assert (not all([x <= y for x, y in zip(values, values[1:])]) and
                 not all([x >= y for x, y in zip(values, values[1:])]))
+
+
+def read_json(path: Path) -> dict:
+    """Reads a json file.
+
+    Args:
+        path: path to the json file
+
+    Returns:
+        The dictionary read from the json file
+    """
+    return loads(Path(path).read_bytes())
@@ -32,6 +32,11 @@ def test_calc_roughness_length_for_heat_transfer():
     assert canopy.calc_roughness_length_for_heat_transfer(1, 0.1) == 0.1
 
 
+def test_calc_log_height_ratio():
+    assert canopy.calc_log_height_ratio(2, 1, 1) == 0
+    assert is_almost_equal(actual=canopy.calc_log_height_ratio(2, 0.67, 0.123), desired=2.38075, decimal=5)
+
+
 def test_calc_wind_speed_at_canopy_height():
     assert (canopy.calc_wind_speed_at_canopy_height(wind_speed=2400, canopy_height=1, measurement_height=2,
                                                     zero_displacement_height=0.67,
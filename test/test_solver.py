@@ -0,0 +1,64 @@
+from crop_energy_balance.solver import Solver
+from crop_energy_balance.utils import is_almost_equal
+
+
+def set_inputs():
+    return dict(measurement_height=2,
+                canopy_height=0.36,
+                soil_saturation_ratio=1.0,
+                leaf_layers={4: 0.09, 5: 1.11, 6: 1.92, 7: 3.22},
+                incident_photosynthetically_active_radiation={'direct': 192, 'diffuse': 35.27},
+                absorbed_photosynthetically_active_radiation={7: {'lumped': 181.15},
+                                                              6: {'lumped': 24.83},
+                                                              5: {'lumped': 6.16},
+                                                              4: {'lumped': 0.35},
+                                                              -1: {'lumped': 14.79}},
+                atmospheric_pressure=101.3,
+                wind_speed=31828.5,
+                air_temperature=26.51,
+                relative_humidity=37.3,
+                vapor_pressure_deficit=1.91,
+                vapor_pressure=1.135,
+                solar_inclination=1.0471975511965976,
+                soil_water_potential=-0.3)
+
+
+def set_params(**kwargs):
+    params = dict(stomatal_sensibility={'leuning': {'d_0': 7}, 'tuzet': {'psi_ref': -0.3, 'steepness': 20}},
+                  soil_aerodynamic_resistance_shape_parameter=2.5,
+                  soil_roughness_length_for_momentum=0.01,
+                  leaf_characteristic_length=0.01,
+                  leaf_boundary_layer_shape_parameter=0.01,
+                  wind_speed_extinction_coef=0.5,
+                  maximum_stomatal_conductance=39.6,
+                  residual_stomatal_conductance=4.0,
+                  leaf_scattering_coefficient=0.15,
+                  absorbed_par_50=105,
+                  soil_resistance_to_vapor_shape_parameter_1=8.206,
+                  soil_resistance_to_vapor_shape_parameter_2=4.255,
+                  step_fraction=0.5,
+                  acceptable_temperature_error=0.02,
+                  maximum_iteration_number=50,
+                  stomatal_density_factor=1)
+    params.update(**kwargs)
+    return params
+
+
+def test_anderson_acceleration():
+    solvers = []
+    for acceleration_depth in (0, 3):
+        # a large step fraction and a tight tolerance make the plain iterations slow enough for acceleration to start
+        solver = Solver(leaves_category='lumped',
+                        inputs_dict=set_inputs(),
+                        params_dict=set_params(step_fraction=2.5, acceptable_temperature_error=1.e-8,
+                                               anderson_acceleration_depth=acceleration_depth))
+        solver.run()
+        solvers.append(solver)
+
+    plain_solver, accelerated_solver = solvers
+    # acceleration only starts after 10 iterations
+    assert plain_solver.iterations_number > 10
+    assert 10 < accelerated_solver.iterations_number <= plain_solver.iterations_number
+    for plain_component, accelerated_component in zip(plain_solver.components, accelerated_solver.components):
+        assert is_almost_equal(actual=accelerated_component.temperature, desired=plain_component.temperature,
+                               decimal=4)
@@ -1,4 +1,4 @@
-from crop_energy_balance.formalisms import sunlit_shaded_leaves
+from crop_energy_balance.formalisms import lumped_leaves, sunlit_shaded_leaves
 from crop_energy_balance.utils import is_almost_equal, assert_trend
 
 
@@ -89,6 +89,12 @@ def test_calc_leaf_layer_surface_conductance_to_vapor():
                          **set_args(leaves_category=category, lower_cumulative_leaf_area_index=lai))
                          for lai in range(10)])
 
+    args = set_args(stomatal_sensibility_to_water_status=0)
+    assert is_almost_equal(
+        desired=lumped_leaves.calc_leaf_layer_surface_conductance_to_vapor(**args),
+        actual=sum([sunlit_shaded_leaves.calc_leaf_layer_surface_conductance_to_vapor(leaves_category=category, **args)
+                    for category in ('sunlit', 'shaded')]))
+
 
 def test_calc_leaf_layer_surface_resistance_to_vapor():
     def set_args(**kwargs):
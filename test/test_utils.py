@@ -0,0 +1,44 @@
+from json import dump
+
+from crop_energy_balance import utils
+
+
+def test_read_json(tmp_path):
+    path = tmp_path / 'params.json'
+    with open(path, mode='w') as f:
+        dump({'step_fraction': 0.5, 'leaf_layers': {'1': 1.0}}, f)
+
+    assert {'step_fraction': 0.5, 'leaf_layers': {'1': 1.0}} == utils.read_json(path)
+    assert utils.read_json(path) == utils.read_json(str(path))
+
+    utils.read_json(path)['step_fraction'] = 0
+    assert 0.5 == utils.read_json(path)['step_fraction']
+
+    with open(path, mode='w') as f:
+        dump({'step_fraction': 0.25}, f)
+    assert {'step_fraction': 0.25} == utils.read_json(path)
+
+
+def test_calc_anderson_acceleration():
+    def fixed_point_map(x):
+        return [0.9 * x[0] + 0.05 * x[1] + 1, 0.05 * x[0] + 0.9 * x[1] - 1]
+
+    def count_iterations(acceleration_depth):
+        iterates, images = [], []
+        x = [0., 0.]
+        for iteration in range(1, 1000):
+            image = fixed_point_map(x)
+            if all(utils.is_almost_equal(actual=a, desired=b, decimal=8) for a, b in zip(image, x)):
+                return iteration, x
+            iterates = (iterates + [x])[-(acceleration_depth + 1):]
+            images = (images + [image])[-(acceleration_depth + 1):]
+            next_x = utils.calc_anderson_acceleration(iterates=iterates, images=images)
+            x = image if next_x is None else next_x
+
+    assert utils.calc_anderson_acceleration(iterates=[[0., 0.]], images=[[1., -1.]]) is None
+
+    picard_iterations, picard_solution = count_iterations(acceleration_depth=0)
+    anderson_iterations, anderson_solution = count_iterations(acceleration_depth=2)
+    assert anderson_iterations < picard_iterations / 10
+    for actual, desired in zip(anderson_solution, [20. / 3, -20. / 3]):
+        assert utils.is_almost_equal(actual=actual, desired=desired, decimal=6)